@@ -33,6 +33,30 @@ class DummyDevice(DefaultGaussian):
     _operation_map['Kerr'] = lambda *x, **y: np.identity(2)
 
 
+def pytest_addoption(parser):
+    """Add command line option to pytest."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="Run tests marked as slow."
+    )
+
+
+def pytest_configure(config):
+    """Register the custom markers used by the test suite."""
+    config.addinivalue_line("markers", "slow: tests that are only run if --runslow is passed")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow, unless the ``--runslow`` option is passed."""
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="Slow test, pass --runslow to run")
+
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture(scope="session")
 def tol():
     """Numerical tolerance for equality tests."""
@@ -97,6 +97,45 @@ def Rot3(a, b, c):
     return Rotz(c) @ (Roty(b) @ Rotz(a))
 
 
+def Rotx_batch(theta):
+    r"""One-qubit rotations about the x axis, for a batch of angles.
+
+    Args:
+        theta (array[float]): rotation angles
+    Returns:
+        array: unitary rotation matrices :math:`e^{-i \sigma_x \theta/2}`
+        of shape ``(len(theta), 2, 2)``
+    """
+    theta = np.asarray(theta)
+    return np.multiply.outer(np.cos(theta / 2), I) + 1j * np.multiply.outer(np.sin(-theta / 2), X)
+
+
+def Roty_batch(theta):
+    r"""One-qubit rotations about the y axis, for a batch of angles.
+
+    Args:
+        theta (array[float]): rotation angles
+    Returns:
+        array: unitary rotation matrices :math:`e^{-i \sigma_y \theta/2}`
+        of shape ``(len(theta), 2, 2)``
+    """
+    theta = np.asarray(theta)
+    return np.multiply.outer(np.cos(theta / 2), I) + 1j * np.multiply.outer(np.sin(-theta / 2), Y)
+
+
+def Rotz_batch(theta):
+    r"""One-qubit rotations about the z axis, for a batch of angles.
+
+    Args:
+        theta (array[float]): rotation angles
+    Returns:
+        array: unitary rotation matrices :math:`e^{-i \sigma_z \theta/2}`
+        of shape ``(len(theta), 2, 2)``
+    """
+    theta = np.asarray(theta)
+    return np.multiply.outer(np.cos(theta / 2), I) + 1j * np.multiply.outer(np.sin(-theta / 2), Z)
+
+
 def CRotx(theta):
     r"""Two-qubit controlled rotation about the x axis.
 
@@ -19,16 +19,79 @@ import numpy as np
 
 import pennylane as qml
 from pennylane.qnodes.rev import ReversibleQNode
+from gate_data import X, Y, Z, Rotx as Rx, Rotx_batch, Roty_batch, Rotz_batch
 
 
+slow = pytest.mark.slow
+
 thetas = np.linspace(-2 * np.pi, 2 * np.pi, 8)
+_THETAS3 = tuple((thetas ** 3 / 19).tolist())
+_THETAS2 = tuple((thetas ** 2).tolist())
+
+# parameter of the scalar multiplier tests
+_MULT_PAR = 0.1
+
+# single-qubit state and observable of the rotation gradient tests; neither is aligned
+# with a rotation axis, so that every Pauli rotation has a nonzero gradient
+_ROT_STATE = np.array([0.8, 0.36 + 0.48j])
+_ROT_OBS = (X + Y + Z) / np.sqrt(3)
+
+# free parameters of the multi-parameter gate tests
+_MULTI_PARAMS = [0.5, 0.3, -0.7]
+
+
+def _multi_param_qnode(device):
+    """ReversibleQNode containing a gate with multiple free parameters."""
+
+    def qf(x, y, z):
+        qml.RX(0.4, wires=[0])
+        qml.Rot(x, y, z, wires=[0])
+        qml.RY(-0.2, wires=[0])
+        return qml.expval(qml.PauliZ(0))
+
+    return ReversibleQNode(qf, device)
+
+
+def _first_positional(a, b):
+    qml.RX(a, wires=0)
+    return qml.expval(qml.PauliZ(0))
+
+
+def _second_positional(a, b):
+    qml.RX(b, wires=0)
+    return qml.expval(qml.PauliZ(0))
+
+
+def _second_third_positional(a, b, c):
+    qml.RX(b, wires=0)
+    qml.RX(c, wires=1)
+    return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+
+@pytest.fixture(scope="module")
+def dev1():
+    return qml.device("default.qubit", wires=1)
+
+
+@pytest.fixture(scope="module")
+def dev2():
+    return qml.device("default.qubit", wires=2)
+
+
+@pytest.fixture(scope="module")
+def dev3():
+    return qml.device("default.qubit", wires=3)
 
 
 class TestExpectationJacobian:
     """Jacobian integration tests for qubit expectations."""
 
-    @pytest.mark.parametrize("mult", [1, -2, 1.623, -0.051, 0])  # intergers, floats, zero
-    def test_parameter_multipliers(self, mult, tol):
+    # integers, floats, zero
+    @pytest.mark.parametrize(
+        "mult, exact",
+        [(m, m * np.cos(m * np.array([[_MULT_PAR]]))) for m in (1, -2, 1.623, -0.051, 0)],
+    )
+    def test_parameter_multipliers(self, mult, exact, tol, dev1):
         """Test that various types and values of scalar multipliers for differentiable
         qfunc parameters yield the correct gradients."""
 
@@ -36,13 +99,11 @@ class TestExpectationJacobian:
             qml.RY(mult * x, wires=[0])
             return qml.expval(qml.PauliX(0))
 
-        dev = qml.device("default.qubit", wires=1)
-        q = ReversibleQNode(circuit, dev)
+        q = ReversibleQNode(circuit, dev1)
 
-        par = [0.1]
+        par = [_MULT_PAR]
 
         # gradients
-        exact = mult * np.cos(mult * np.array([par]))
         grad_F = q.jacobian(par, method="F")
         grad_A = q.jacobian(par, method="A")
 
@@ -50,16 +111,12 @@ class TestExpectationJacobian:
         assert grad_F == pytest.approx(exact, abs=tol)
         assert grad_A == pytest.approx(exact, abs=tol)
 
-    @pytest.mark.parametrize("reused_p", thetas ** 3 / 19)
-    @pytest.mark.parametrize("other_p", thetas ** 2 / 1)
-    def test_fanout_multiple_params(self, reused_p, other_p, tol):
+    def test_fanout_multiple_params(self, tol, dev1):
         """Tests that the correct gradient is computed for qnodes which
         use the same parameter in multiple gates."""
 
-        from gate_data import Rotx as Rx, Roty as Ry, Rotz as Rz
-
         def expZ(state):
-            return np.abs(state[0]) ** 2 - np.abs(state[1]) ** 2
+            return np.abs(state[..., 0]) ** 2 - np.abs(state[..., 1]) ** 2
 
         extra_param = 0.31
 
@@ -70,33 +127,39 @@ class TestExpectationJacobian:
             qml.RX(reused_param, wires=[0])
             return qml.expval(qml.PauliZ(0))
 
-        dev = qml.device("default.qubit", wires=1)
-        f = ReversibleQNode(circuit, dev)
-        zero_state = np.array([1.0, 0.0])
+        f = ReversibleQNode(circuit, dev1)
+        reused_p = np.array(_THETAS3)
+        other_p = np.array(_THETAS2)
 
-        # analytic gradient
-        grad_A = f.jacobian([reused_p, other_p])
+        # analytic gradient over the (reused_p, other_p) grid
+        grad_A = np.array([[f.jacobian([p1, p2])[0, 0] for p2 in other_p] for p1 in reused_p])
 
-        # manual gradient
-        grad_true0 = (
-            expZ(
-                Rx(reused_p) @ Rz(other_p) @ Ry(reused_p + np.pi / 2) @ Rx(extra_param) @ zero_state
-            )
-            - expZ(
-                Rx(reused_p) @ Rz(other_p) @ Ry(reused_p - np.pi / 2) @ Rx(extra_param) @ zero_state
+        # manual gradient, computed over the whole grid at once
+        zero_state = np.array([1.0, 0.0])
+        Rz_other = Rotz_batch(other_p)
+
+        def final_state(rx_params, ry_params):
+            """Final states of shape (len(reused_p), len(other_p), 2)"""
+            return np.einsum(
+                "iab,jbc,icd,de,e->ija",
+                Rotx_batch(rx_params),
+                Rz_other,
+                Roty_batch(ry_params),
+                Rx(extra_param),
+                zero_state,
             )
+
+        grad_true0 = (
+            expZ(final_state(reused_p, reused_p + np.pi / 2))
+            - expZ(final_state(reused_p, reused_p - np.pi / 2))
         ) / 2
         grad_true1 = (
-            expZ(
-                Rx(reused_p + np.pi / 2) @ Rz(other_p) @ Ry(reused_p) @ Rx(extra_param) @ zero_state
-            )
-            - expZ(
-                Rx(reused_p - np.pi / 2) @ Rz(other_p) @ Ry(reused_p) @ Rx(extra_param) @ zero_state
-            )
+            expZ(final_state(reused_p + np.pi / 2, reused_p))
+            - expZ(final_state(reused_p - np.pi / 2, reused_p))
         ) / 2
         grad_true = grad_true0 + grad_true1  # product rule
 
-        assert grad_A[0, 0] == pytest.approx(grad_true, abs=tol)
+        assert grad_A == pytest.approx(grad_true, abs=tol)
 
     @pytest.mark.parametrize("shape", [(8,), (8, 1), (4, 2), (2, 2, 2), (2, 1, 2, 1, 2)])
     def test_multidim_array_parameter(self, shape, tol):
@@ -125,31 +188,31 @@ class TestExpectationJacobian:
         expected_jacobian = -np.diag(np.sin(base_array))
         assert circuit_jacobian == pytest.approx(expected_jacobian, abs=tol)
 
-    def test_gradient_gate_with_multiple_parameters(self, tol):
-        """Tests that gates with multiple free parameters yield correct gradients."""
-        par = [0.5, 0.3, -0.7]
-
-        def qf(x, y, z):
-            qml.RX(0.4, wires=[0])
-            qml.Rot(x, y, z, wires=[0])
-            qml.RY(-0.2, wires=[0])
-            return qml.expval(qml.PauliZ(0))
-
-        dev = qml.device("default.qubit", wires=1)
-        q = ReversibleQNode(qf, dev)
-        value = q(*par)
-        grad_A = q.jacobian(par, method="A")
-        grad_F = q.jacobian(par, method="F")
+    def test_gradient_gate_with_multiple_parameters(self, dev1):
+        """Tests that gates with multiple free parameters yield a gradient
+        for every parameter."""
+        q = _multi_param_qnode(dev1)
+        value = q(*_MULTI_PARAMS)
+        grad_A = q.jacobian(_MULTI_PARAMS, method="A")
 
         # analytic method works for every parameter
         assert q.par_to_grad_method == {0: "A", 1: "A", 2: "A"}
         # gradient has the correct shape and every element is nonzero
         assert grad_A.shape == (1, 3)
-        assert np.count_nonzero(grad_A) == 3
+        assert np.all(grad_A != 0)
+
+    @slow
+    def test_gradient_gate_with_multiple_parameters_numeric(self, tol, dev1):
+        """Tests that the gradients of gates with multiple free parameters
+        match between the finite difference and analytic methods."""
+        q = _multi_param_qnode(dev1)
+        grad_A = q.jacobian(_MULTI_PARAMS, method="A")
+        grad_F = q.jacobian(_MULTI_PARAMS, method="F")
+
         # the different methods agree
         assert grad_A == pytest.approx(grad_F, abs=tol)
 
-    def test_gradient_repeated_gate_parameters(self, tol):
+    def test_gradient_repeated_gate_parameters(self, tol, dev1):
         """Tests that repeated use of a free parameter in a
         multi-parameter gate yield correct gradients."""
         par = [0.8, 1.3]
@@ -159,15 +222,14 @@ class TestExpectationJacobian:
             qml.Rot(y, x, 2 * x, wires=[0])
             return qml.expval(qml.PauliX(0))
 
-        dev = qml.device("default.qubit", wires=1)
-        q = ReversibleQNode(qf, dev)
+        q = ReversibleQNode(qf, dev1)
         grad_A = q.jacobian(par, method="A")
         grad_F = q.jacobian(par, method="F")
 
         # the different methods agree
         assert grad_A == pytest.approx(grad_F, abs=tol)
 
-    def test_gradient_parameters_inside_array(self, tol):
+    def test_gradient_parameters_inside_array(self, tol, dev1):
         """Tests that free parameters inside an array passed to
         an Operation yield correct gradients."""
         par = [0.8, 1.3]
@@ -177,8 +239,7 @@ class TestExpectationJacobian:
             qml.RY(x, wires=[0])
             return qml.expval(qml.Hermitian(np.diag([y, 1]), 0))
 
-        dev = qml.device("default.qubit", wires=1)
-        q = ReversibleQNode(qf, dev)
+        q = ReversibleQNode(qf, dev1)
         grad = q.jacobian(par)
         grad_F = q.jacobian(par, method="F")
 
@@ -187,7 +248,7 @@ class TestExpectationJacobian:
         # the different methods agree
         assert grad == pytest.approx(grad_F, abs=tol)
 
-    def test_keywordarg_not_differentiated(self, tol):
+    def test_keywordarg_not_differentiated(self, tol, dev2):
         """Tests that qnodes do not differentiate w.r.t. keyword arguments."""
         par = np.array([0.5, 0.54])
 
@@ -197,8 +258,7 @@ class TestExpectationJacobian:
             qml.CNOT(wires=[0, 1])
             return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(1))
 
-        dev = qml.device("default.qubit", wires=2)
-        circuit1 = ReversibleQNode(circuit1, dev)
+        circuit1 = ReversibleQNode(circuit1, dev2)
 
         def circuit2(weights):
             qml.QubitStateVector(np.array([1, 0, 1, 1]) / np.sqrt(3), wires=[0, 1])
@@ -206,13 +266,13 @@ class TestExpectationJacobian:
             qml.CNOT(wires=[0, 1])
             return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(1))
 
-        circuit2 = ReversibleQNode(circuit2, dev)
+        circuit2 = ReversibleQNode(circuit2, dev2)
 
         res1 = circuit1.jacobian([par])
         res2 = circuit2.jacobian([par])
         assert res1 == pytest.approx(res2, abs=tol)
 
-    def test_differentiate_all_positional(self, tol):
+    def test_differentiate_all_positional(self, tol, dev3):
         """Tests that all positional arguments are differentiated."""
 
         def circuit1(a, b, c):
@@ -221,8 +281,7 @@ class TestExpectationJacobian:
             qml.RX(c, wires=2)
             return tuple(qml.expval(qml.PauliZ(idx)) for idx in range(3))
 
-        dev = qml.device("default.qubit", wires=3)
-        circuit1 = ReversibleQNode(circuit1, dev)
+        circuit1 = ReversibleQNode(circuit1, dev3)
 
         vals = np.array([np.pi, np.pi / 2, np.pi / 3])
         circuit_output = circuit1(*vals)
@@ -234,72 +293,33 @@ class TestExpectationJacobian:
         expected_jacobian = -np.diag(np.sin(vals))
         assert circuit_jacobian == pytest.approx(expected_jacobian, abs=tol)
 
-    def test_differentiate_first_positional(self, tol):
-        """Tests that the first positional arguments are differentiated."""
-
-        def circuit2(a, b):
-            qml.RX(a, wires=0)
-            return qml.expval(qml.PauliZ(0))
-
-        dev = qml.device("default.qubit", wires=2)
-        circuit2 = ReversibleQNode(circuit2, dev)
-
-        a = 0.7418
-        b = -5.0
-        circuit_output = circuit2(a, b)
-        expected_output = np.cos(a)
-        assert circuit_output == pytest.approx(expected_output, abs=tol)
-
-        # circuit jacobians
-        circuit_jacobian = circuit2.jacobian([a, b])
-        expected_jacobian = np.array([[-np.sin(a), 0]])
-        assert circuit_jacobian == pytest.approx(expected_jacobian, abs=tol)
-
-    def test_differentiate_second_positional(self, tol):
-        """Tests that the second positional arguments are differentiated."""
-
-        def circuit3(a, b):
-            qml.RX(b, wires=0)
-            return qml.expval(qml.PauliZ(0))
-
-        dev = qml.device("default.qubit", wires=2)
-        circuit3 = ReversibleQNode(circuit3, dev)
-
-        a = 0.7418
-        b = -5.0
-        circuit_output = circuit3(a, b)
-        expected_output = np.cos(b)
-        assert circuit_output == pytest.approx(expected_output, abs=tol)
-
-        # circuit jacobians
-        circuit_jacobian = circuit3.jacobian([a, b])
-        expected_jacobian = np.array([[0, -np.sin(b)]])
-        assert circuit_jacobian == pytest.approx(expected_jacobian, abs=tol)
-
-    def test_differentiate_second_third_positional(self, tol):
-        """Tests that the second and third positional arguments are differentiated."""
-
-        def circuit4(a, b, c):
-            qml.RX(b, wires=0)
-            qml.RX(c, wires=1)
-            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
-
-        dev = qml.device("default.qubit", wires=2)
-        circuit4 = ReversibleQNode(circuit4, dev)
-
-        a = 0.7418
-        b = -5.0
-        c = np.pi / 7
-        circuit_output = circuit4(a, b, c)
-        expected_output = np.array([np.cos(b), np.cos(c)])
+    @pytest.mark.parametrize(
+        "qfunc, params, expected_output, expected_jacobian",
+        [
+            (qfunc, p, np.cos(p[idx]), -np.eye(len(p))[idx] * np.sin(p))
+            for qfunc, p, idx in [
+                (_first_positional, np.array([0.7418, -5.0]), [0]),
+                (_second_positional, np.array([0.7418, -5.0]), [1]),
+                (_second_third_positional, np.array([0.7418, -5.0, np.pi / 7]), [1, 2]),
+            ]
+        ],
+        ids=["first", "second", "second_third"],
+    )
+    def test_differentiate_some_positional(
+        self, qfunc, params, expected_output, expected_jacobian, tol, dev2
+    ):
+        """Tests that only the positional arguments used in the circuit are differentiated,
+        and that the unused named arguments have a zero jacobian column."""
+        circuit = ReversibleQNode(qfunc, dev2)
+
+        circuit_output = circuit(*params)
         assert circuit_output == pytest.approx(expected_output, abs=tol)
 
         # circuit jacobians
-        circuit_jacobian = circuit4.jacobian([a, b, c])
-        expected_jacobian = np.array([[0.0, -np.sin(b), 0.0], [0.0, 0.0, -np.sin(c)]])
+        circuit_jacobian = circuit.jacobian(params)
         assert circuit_jacobian == pytest.approx(expected_jacobian, abs=tol)
 
-    def test_differentiate_positional_multidim(self, tol):
+    def test_differentiate_positional_multidim(self, tol, dev3):
         """Tests that all positional arguments are differentiated
         when they are multidimensional."""
 
@@ -313,8 +333,7 @@ class TestExpectationJacobian:
                 qml.expval(qml.PauliZ(2)),
             )
 
-        dev = qml.device("default.qubit", wires=3)
-        circuit = ReversibleQNode(circuit, dev)
+        circuit = ReversibleQNode(circuit, dev3)
 
         a = np.array([-np.sqrt(2), -0.54])
         b = np.array([np.pi / 7] * 6).reshape([3, 2])
@@ -333,10 +352,9 @@ class TestExpectationJacobian:
         )  # expval 2
         assert circuit_jacobian == pytest.approx(expected_jacobian, abs=tol)
 
-    def test_array_parameters_evaluate(self, tol):
+    def test_array_parameters_evaluate(self, tol, dev2):
         """Tests that array parameters gives same result as positional arguments."""
         a, b, c = 0.5, 0.54, 0.3
-        dev = qml.device("default.qubit", wires=2)
 
         def ansatz(x, y, z):
             qml.QubitStateVector(np.array([1, 0, 1, 1]) / np.sqrt(3), wires=[0, 1])
@@ -353,9 +371,9 @@ class TestExpectationJacobian:
         def circuit3(array):
             return ansatz(*array)
 
-        circuit1 = ReversibleQNode(circuit1, dev)
-        circuit2 = ReversibleQNode(circuit2, dev)
-        circuit3 = ReversibleQNode(circuit3, dev)
+        circuit1 = ReversibleQNode(circuit1, dev2)
+        circuit2 = ReversibleQNode(circuit2, dev2)
+        circuit3 = ReversibleQNode(circuit3, dev2)
 
         positional_res = circuit1(a, b, c)
         positional_grad = circuit1.jacobian([a, b, c])
@@ -381,91 +399,84 @@ class TestExpectationJacobian:
         assert positional_res == pytest.approx(array_res, abs=tol)
         assert positional_grad == pytest.approx(array_grad, abs=tol)
 
-    @pytest.mark.parametrize("theta", thetas)
     @pytest.mark.parametrize("G", [qml.ops.RX, qml.ops.RY, qml.ops.RZ])
-    def test_pauli_rotation_gradient(self, G, theta, tol):
+    def test_pauli_rotation_gradient(self, G, tol, dev1):
         """Tests that the automatic gradients of Pauli rotations are correct."""
 
         def circuit(x):
-            qml.RX(x, wires=[0])
-            return qml.expval(qml.PauliZ(0))
+            qml.QubitStateVector(_ROT_STATE, wires=0)
+            G(x, wires=[0])
+            return qml.expval(qml.Hermitian(_ROT_OBS, wires=0))
 
-        dev = qml.device("default.qubit", wires=1)
-        circuit = ReversibleQNode(circuit, dev)
+        # the immutable circuit is only constructed once, and reused for every theta
+        circuit = ReversibleQNode(circuit, dev1, mutable=False)
+
+        shifted = np.array([[circuit(t + s) for t in thetas] for s in (np.pi / 2, -np.pi / 2)])
+        manualgrad_val = (shifted[0] - shifted[1]) / 2
+        autograd_val = np.array([circuit.jacobian([t]) for t in thetas])
 
-        autograd_val = circuit.jacobian([theta])
-        manualgrad_val = (circuit(theta + np.pi / 2) - circuit(theta - np.pi / 2)) / 2
-        assert autograd_val == pytest.approx(manualgrad_val, abs=tol)
+        assert autograd_val.ravel() == pytest.approx(manualgrad_val.ravel(), abs=tol)
 
-    @pytest.mark.parametrize("theta", thetas)
-    def test_Rot_gradient(self, theta, tol):
+    def test_Rot_gradient(self, tol, dev1):
         """Tests that the automatic gradient of a arbitrary Euler-angle-parameterized gate is correct."""
 
         def circuit(x, y, z):
+            qml.QubitStateVector(_ROT_STATE, wires=0)
             qml.Rot(x, y, z, wires=[0])
-            return qml.expval(qml.PauliZ(0))
+            return qml.expval(qml.Hermitian(_ROT_OBS, wires=0))
 
-        dev = qml.device("default.qubit", wires=1)
-        circuit = ReversibleQNode(circuit, dev)
-        eye = np.eye(3)
+        # the immutable circuit is only constructed once, and reused for every theta
+        circuit = ReversibleQNode(circuit, dev1, mutable=False)
+        shifts = np.pi / 2 * np.eye(3)
 
-        angle_inputs = np.array([theta, theta ** 3, np.sqrt(2) * theta])
-        autograd_val = circuit.jacobian(angle_inputs)
-        manualgrad_val = np.zeros((1, 3))
+        for theta in thetas:
+            angle_inputs = np.array([theta, theta ** 3, np.sqrt(2) * theta])
+            autograd_val = circuit.jacobian(angle_inputs)
 
-        for idx in range(3):
-            onehot_idx = eye[idx]
-            param1 = angle_inputs + np.pi / 2 * onehot_idx
-            param2 = angle_inputs - np.pi / 2 * onehot_idx
-            manualgrad_val[0, idx] = (circuit(*param1) - circuit(*param2)) / 2
+            # all six shifted parameter vectors, forward shifts first
+            all_params = np.vstack([angle_inputs + shifts, angle_inputs - shifts])
+            res = np.array([circuit(*p) for p in all_params]).reshape(2, 3)
+            manualgrad_val = (res[0] - res[1])[np.newaxis] / 2
 
-        assert autograd_val == pytest.approx(manualgrad_val, abs=tol)
+            assert autograd_val == pytest.approx(manualgrad_val, abs=tol)
 
-    @pytest.mark.parametrize("op, name", [(qml.CRX, "CRX"), (qml.CRY, "CRY"), (qml.CRZ, "CRZ")])
-    def test_controlled_rotation_gates_exception(self, op, name):
-        """Tests that an exception is raised when a controlled
-        rotation gate is used with the ReversibleQNode."""
+    @pytest.mark.parametrize(
+        "op, wires, name",
+        [
+            (qml.CRX, [0, 1], "CRX"),
+            (qml.CRY, [0, 1], "CRY"),
+            (qml.CRZ, [0, 1], "CRZ"),
+            (qml.PhaseShift, [0], "PhaseShift"),
+        ],
+    )
+    def test_unsupported_gate_exception(self, op, wires, name, dev2):
+        """Tests that an exception is raised when an unsupported
+        gate is used with the ReversibleQNode."""
         # remove this test when this support is added
-        dev = qml.device("default.qubit", wires=2)
 
         def circuit(x):
             qml.PauliX(wires=0)
-            op(x, wires=[0, 1])
+            op(x, wires=wires)
             return qml.expval(qml.PauliZ(0))
 
-        circuit = ReversibleQNode(circuit, dev)
+        circuit = ReversibleQNode(circuit, dev2)
         with pytest.raises(ValueError, match="The {} gate is not currently supported".format(name)):
             circuit.jacobian([0.542])
 
-    def test_phaseshift_exception(self):
-        """Tests that an exception is raised when a PhaseShift gate
-        is used with the ReversibleQNode."""
-        # remove this test when this support is added
-        dev = qml.device("default.qubit", wires=1)
-
-        def circuit(x):
-            qml.PauliX(wires=0)
-            qml.PhaseShift(x, wires=0)
-            return qml.expval(qml.PauliZ(0))
-
-        circuit = ReversibleQNode(circuit, dev)
-
-        with pytest.raises(ValueError, match="The PhaseShift gate is not currently supported"):
-            circuit.jacobian([0.542])
-
     @pytest.mark.xfail(
-        reason="The ReversibleQNode does not support gradients of the PhaseShift gate."
+        reason="The ReversibleQNode does not support gradients of the PhaseShift gate.",
+        run=False,
+        strict=False,
     )
-    def test_phaseshift_gradient(self, tol):
+    def test_phaseshift_gradient(self, tol, dev1):
         """Test gradient of PhaseShift gate"""
-        dev = qml.device("default.qubit", wires=1)
 
         def circuit(x):
             qml.Hadamard(wires=0)
             qml.PhaseShift(x, wires=0)
             return qml.expval(qml.PauliZ(0))
 
-        circuit = ReversibleQNode(circuit, dev)
+        circuit = ReversibleQNode(circuit, dev1)
 
         a = 0.542  # any value of a should give zero gradient
 
@@ -485,7 +496,7 @@ class TestExpectationJacobian:
             qml.PhaseShift(x, wires=0)
             return qml.expval(qml.PauliY(0))
 
-        circuit1 = ReversibleQNode(circuit1, dev)
+        circuit1 = ReversibleQNode(circuit1, dev1)
 
         b = 0.123  # gradient is -sin(b)
 
@@ -501,18 +512,19 @@ class TestExpectationJacobian:
         assert gradA == pytest.approx(expected, abs=tol)
 
     @pytest.mark.xfail(
-        reason="The ReversibleQNode does not support gradients of controlled rotations"
+        reason="The ReversibleQNode does not support gradients of controlled rotations",
+        run=False,
+        strict=False,
     )
-    def test_controlled_RX_gradient(self, tol):
+    def test_controlled_RX_gradient(self, tol, dev2):
         """Test gradient of controlled RX gate"""
-        dev = qml.device("default.qubit", wires=2)
 
         def circuit(x):
             qml.PauliX(wires=0)
             qml.CRX(x, wires=[0, 1])
             return qml.expval(qml.PauliZ(0))
 
-        circuit = ReversibleQNode(circuit, dev)
+        circuit = ReversibleQNode(circuit, dev2)
 
         a = 0.542  # any value of a should give zero gradient
 
@@ -532,7 +544,7 @@ class TestExpectationJacobian:
             qml.CRX(x, wires=[0, 1])
             return qml.expval(qml.PauliZ(0))
 
-        circuit1 = ReversibleQNode(circuit1, dev)
+        circuit1 = ReversibleQNode(circuit1, dev2)
 
         b = 0.123  # gradient is -sin(x)
 
@@ -548,18 +560,19 @@ class TestExpectationJacobian:
         assert gradA == pytest.approx(expected, abs=tol)
 
     @pytest.mark.xfail(
-        reason="The ReversibleQNode does not support gradients of controlled rotations"
+        reason="The ReversibleQNode does not support gradients of controlled rotations",
+        run=False,
+        strict=False,
     )
-    def test_controlled_RY_gradient(self, tol):
+    def test_controlled_RY_gradient(self, tol, dev2):
         """Test gradient of controlled RY gate"""
-        dev = qml.device("default.qubit", wires=2)
 
         def circuit(x):
             qml.PauliX(wires=0)
             qml.CRY(x, wires=[0, 1])
             return qml.expval(qml.PauliZ(0))
 
-        circuit = ReversibleQNode(circuit, dev)
+        circuit = ReversibleQNode(circuit, dev2)
 
         a = 0.542  # any value of a should give zero gradient
 
@@ -579,7 +592,7 @@ class TestExpectationJacobian:
             qml.CRY(x, wires=[0, 1])
             return qml.expval(qml.PauliZ(0))
 
-        circuit1 = ReversibleQNode(circuit1, dev)
+        circuit1 = ReversibleQNode(circuit1, dev2)
 
         b = 0.123  # gradient is -sin(x)
 
@@ -595,18 +608,19 @@ class TestExpectationJacobian:
         assert gradA == pytest.approx(expected, abs=tol)
 
     @pytest.mark.xfail(
-        reason="The ReversibleQNode does not support gradients of controlled rotations"
+        reason="The ReversibleQNode does not support gradients of controlled rotations",
+        run=False,
+        strict=False,
     )
-    def test_controlled_RZ_gradient(self, tol):
+    def test_controlled_RZ_gradient(self, tol, dev2):
         """Test gradient of controlled RZ gate"""
-        dev = qml.device("default.qubit", wires=2)
 
         def circuit(x):
             qml.PauliX(wires=0)
             qml.CRZ(x, wires=[0, 1])
             return qml.expval(qml.PauliZ(0))
 
-        circuit = ReversibleQNode(circuit, dev)
+        circuit = ReversibleQNode(circuit, dev2)
 
         a = 0.542  # any value of a should give zero gradient
 
@@ -626,7 +640,7 @@ class TestExpectationJacobian:
             qml.CRZ(x, wires=[0, 1])
             return qml.expval(qml.PauliZ(0))
 
-        circuit1 = ReversibleQNode(circuit1, dev)
+        circuit1 = ReversibleQNode(circuit1, dev2)
 
         b = 0.123  # gradient is -sin(x)
 
@@ -645,22 +659,20 @@ class TestExpectationJacobian:
 class TestIntegration:
     """Integration tests for ReversibleQNode."""
 
-    def test_incapable_device_exception(self, monkeypatch):
+    def test_incapable_device_exception(self, monkeypatch, dev1):
         """Test that an exception is raised if the reversible diff_method
         is specified for a device which does not have reversible capability."""
-        dev = qml.device("default.qubit", wires=1)
-
         # overwrite capabilities
-        capabilities = dev.capabilities().copy()
+        capabilities = dev1.capabilities().copy()
         capabilities["supports_reversible_diff"] = False
-        monkeypatch.setattr(dev, 'capabilities', lambda: capabilities)
+        monkeypatch.setattr(dev1, 'capabilities', lambda: capabilities)
 
         def circuit(a):
             qml.RX(a, wires=0)
             return qml.expval(qml.PauliZ(wires=0))
 
         with pytest.raises(ValueError, match="Reversible differentiation method not supported"):
-            ReversibleQNode(circuit, dev)
+            ReversibleQNode(circuit, dev1)
 
 
 class TestHelperFunctions:
@@ -674,25 +686,37 @@ class TestHelperFunctions:
     two_qubit_obs = qml.Hermitian(np.eye(4), wires=[0, 1])
 
     @pytest.mark.parametrize(
-        "wires, vec1, obs, vec2, expected",
+        "wires, cases",
         [
-            (1, one_qubit_vec1, single_qubit_obs1, one_qubit_vec1, 0),
-            (1, one_qubit_vec2, single_qubit_obs1, one_qubit_vec2, 0),
-            (1, one_qubit_vec1, single_qubit_obs1, one_qubit_vec2, 1 - 1j),
-            (1, one_qubit_vec2, single_qubit_obs1, one_qubit_vec1, 1 + 1j),
-            (1, one_qubit_vec1, single_qubit_obs2, one_qubit_vec1, 0),
-            (1, one_qubit_vec2, single_qubit_obs2, one_qubit_vec2, 2),
-            (1, one_qubit_vec1, single_qubit_obs2, one_qubit_vec2, 1 + 1j),
-            (1, one_qubit_vec2, single_qubit_obs2, one_qubit_vec1, 1 - 1j),
-            (2, two_qubit_vec, single_qubit_obs1, two_qubit_vec, 0),
-            (2, two_qubit_vec, single_qubit_obs2, two_qubit_vec, 0),
-            (2, two_qubit_vec, two_qubit_obs, two_qubit_vec, 4),
+            (
+                1,
+                [
+                    (one_qubit_vec1, single_qubit_obs1, one_qubit_vec1, 0),
+                    (one_qubit_vec2, single_qubit_obs1, one_qubit_vec2, 0),
+                    (one_qubit_vec1, single_qubit_obs1, one_qubit_vec2, 1 - 1j),
+                    (one_qubit_vec2, single_qubit_obs1, one_qubit_vec1, 1 + 1j),
+                    (one_qubit_vec1, single_qubit_obs2, one_qubit_vec1, 0),
+                    (one_qubit_vec2, single_qubit_obs2, one_qubit_vec2, 2),
+                    (one_qubit_vec1, single_qubit_obs2, one_qubit_vec2, 1 + 1j),
+                    (one_qubit_vec2, single_qubit_obs2, one_qubit_vec1, 1 - 1j),
+                ],
+            ),
+            (
+                2,
+                [
+                    (two_qubit_vec, single_qubit_obs1, two_qubit_vec, 0),
+                    (two_qubit_vec, single_qubit_obs2, two_qubit_vec, 0),
+                    (two_qubit_vec, two_qubit_obs, two_qubit_vec, 4),
+                ],
+            ),
         ],
     )
-    def test_matrix_elem(self, wires, vec1, obs, vec2, expected):
+    def test_matrix_elem(self, wires, cases, tol):
         """Tests for the helper function _matrix_elem"""
         dev = qml.device("default.qubit", wires=wires)
         mock_circuit = lambda: None
         qnode = ReversibleQNode(mock_circuit, dev)
-        res = qnode._matrix_elem(vec1, obs, vec2)
-        assert res == expected
+
+        res = [qnode._matrix_elem(vec1, obs, vec2) for vec1, obs, vec2, _ in cases]
+        expected = [c[-1] for c in cases]
+        assert np.allclose(res, expected, atol=tol, rtol=0)
@@ -17,19 +17,163 @@ from pennylane import numpy as np
 
 import pennylane as qml
 from pennylane.tape.interfaces.autograd import AutogradInterface
-from pennylane.tape import JacobianTape, ReversibleTape, QNode, qnode
+from pennylane.tape import JacobianTape, ReversibleTape, QNode
 from pennylane.tape.measure import MeasurementProcess
+from gate_data import X, Y, Z, Rotx as Rx, Rotx_batch, Roty_batch, Rotz_batch
 
 
+slow = pytest.mark.slow
+
 thetas = np.linspace(-2 * np.pi, 2 * np.pi, 8)
+_THETAS3 = tuple((thetas ** 3 / 19).tolist())
+_THETAS2 = tuple((thetas ** 2).tolist())
+
+# rotation angles of the single-qubit rotation gradient tests
+_ROT_THETA = np.linspace(-2 * np.pi, 2 * np.pi, 7)
+_ROT_PARAMS = np.stack([_ROT_THETA, _ROT_THETA ** 3, np.sqrt(2) * _ROT_THETA], axis=1)
+
+# single-qubit state and observable of the rotation gradient tests; neither is aligned
+# with a rotation axis, so that every Pauli rotation has a nonzero gradient
+_ROT_STATE = np.array([0.8, 0.36 + 0.48j])
+_ROT_OBS = (X + Y + Z) / np.sqrt(3)
+
+# analytic qubit operations not yet supported by the reversible method
+_EXCLUDED = frozenset(
+    {
+        qml.CRX,
+        qml.CRY,
+        qml.CRZ,
+        qml.CRot,
+        qml.PhaseShift,
+        qml.PauliRot,
+        qml.MultiRZ,
+        qml.U1,
+        qml.U2,
+        qml.U3,
+    }
+)
+_ANALYTIC_OPS = tuple(
+    cls
+    for cls in (getattr(qml, name) for name in sorted(qml.ops._qubit__ops__))
+    if cls.grad_method == "A" and cls not in _EXCLUDED
+)
+
+
+def _name_id(v):
+    """Readable parametrization ids, given by the name of the operation or observable
+    class. The collection order itself is kept stable across ``pytest -n auto`` workers
+    by sorting ``_ANALYTIC_OPS``."""
+    return v.__name__ if hasattr(v, "__name__") else str(v)
+
+
+def _param_shift_jacobians(tape, params, device):
+    """Computes the parameter-shift jacobian of an expectation value tape
+    for every row of trainable parameters in ``params``.
+
+    The forward and backward shifts of all rows are stacked into a single
+    array of shape ``(2 * len(params) * num_params, num_params)`` and
+    executed on the device as one batch. The original tape is left unmodified.
+
+    Returns:
+        array: jacobians of shape ``(len(params), num_outputs, num_params)``
+    """
+    batch_size, num_params = params.shape
+    shifts = np.pi / 2 * np.eye(num_params)
+
+    shifted_params = np.vstack(
+        [
+            (params[:, None] + shifts).reshape(-1, num_params),
+            (params[:, None] - shifts).reshape(-1, num_params),
+        ]
+    )
+
+    tapes = []
+
+    for p in shifted_params:
+        shifted = tape.copy(copy_operations=True)
+        shifted.set_parameters(p)
+        tapes.append(shifted)
+
+    res = np.array(device.batch_execute(tapes)).reshape(2, batch_size, num_params, -1)
+    return np.swapaxes(res[0] - res[1], 1, 2) / 2
+
+
+def _rotation_tape(op, params):
+    """Reversible tape applying the single-qubit rotation ``op`` to a fixed
+    state, with every rotation angle trainable."""
+    with ReversibleTape() as tape:
+        qml.QubitStateVector(_ROT_STATE, wires=0)
+        op(*params, wires=[0])
+        qml.expval(qml.Hermitian(_ROT_OBS, wires=0))
+
+    tape.trainable_params = set(range(1, 1 + len(params)))
+    return tape
+
+
+def _multi_param_tape():
+    """Reversible tape containing a gate with multiple free parameters."""
+    with ReversibleTape() as tape:
+        qml.RX(0.4, wires=[0])
+        qml.Rot(0.5, 0.3, -0.7, wires=[0])
+        qml.RY(-0.2, wires=[0])
+        qml.expval(qml.PauliZ(0))
+
+    tape.trainable_params = {1, 2, 3}
+    return tape
+
+
+@pytest.fixture(scope="module")
+def dev1():
+    return qml.device("default.qubit", wires=1)
+
+
+@pytest.fixture(scope="module")
+def dev2():
+    return qml.device("default.qubit", wires=2)
+
+
+@pytest.fixture(scope="module")
+def dev3():
+    return qml.device("default.qubit", wires=3)
+
+
+@pytest.fixture(scope="module")
+def tape_cache():
+    """Builds the tape used by ``test_gradients`` once per analytic operation.
+    The gradient information is computed up-front, and only the first
+    measurement is replaced by the tests."""
+    cache = {}
+
+    for op in _ANALYTIC_OPS:
+        args = np.linspace(0.2, 0.5, op.num_params)
+
+        with ReversibleTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.RX(0.543, wires=0)
+            qml.CNOT(wires=[0, 1])
+
+            op(*args, wires=range(op.num_wires))
+
+            qml.Rot(1.3, -2.3, 0.5, wires=[0])
+            qml.RZ(-0.5, wires=0)
+            qml.RY(0.5, wires=1)
+            qml.CNOT(wires=[0, 1])
+
+            qml.expval(qml.PauliX(wires=0))
+            qml.expval(qml.PauliZ(wires=1))
+
+        tape._update_gradient_info()
+        tape.trainable_params = set(range(1, 1 + op.num_params))
+        cache[op] = tape
+
+    return cache
 
 
 class TestReversibleTape:
     """Unit tests for the reversible tape"""
 
-    def test_diff_circuit_construction(self, mocker):
+    def test_diff_circuit_construction(self, mocker, dev2):
         """Test that the diff circuit is correctly constructed"""
-        dev = qml.device("default.qubit", wires=2)
 
         with ReversibleTape() as tape:
             qml.PauliX(wires=0)
@@ -37,8 +181,8 @@ class TestReversibleTape:
             qml.RY(0.542, wires=0)
             qml.expval(qml.PauliZ(0))
 
-        spy = mocker.spy(dev, "execute")
-        tape.jacobian(dev)
+        spy = mocker.spy(dev2, "execute")
+        tape.jacobian(dev2)
 
         tape0 = spy.call_args_list[0][0][0]
         tape1 = spy.call_args_list[1][0][0]
@@ -58,17 +202,16 @@ class TestReversibleTape:
         assert tape1.operations[0].name == "QubitStateVector"
         assert tape2.operations[1].name == "PauliY"
 
-    def test_rot_diff_circuit_construction(self, mocker):
+    def test_rot_diff_circuit_construction(self, mocker, dev2):
         """Test that the diff circuit is correctly constructed for the Rot gate"""
-        dev = qml.device("default.qubit", wires=2)
 
         with ReversibleTape() as tape:
             qml.PauliX(wires=0)
             qml.Rot(0.1, 0.2, 0.3, wires=0)
             qml.expval(qml.PauliZ(0))
 
-        spy = mocker.spy(dev, "execute")
-        tape.jacobian(dev)
+        spy = mocker.spy(dev2, "execute")
+        tape.jacobian(dev2)
 
         tape0 = spy.call_args_list[0][0][0]
         tape1 = spy.call_args_list[1][0][0]
@@ -98,259 +241,247 @@ class TestReversibleTape:
         assert tape1.operations[0].name == "QubitStateVector"
         assert tape3.operations[1].name == "PauliZ"
 
-    @pytest.mark.parametrize("op, name", [(qml.CRX, "CRX"), (qml.CRY, "CRY"), (qml.CRZ, "CRZ")])
-    def test_controlled_rotation_gates_exception(self, op, name):
-        """Tests that an exception is raised when a controlled
-        rotation gate is used with the ReversibleTape."""
-        # TODO: remove this test when this support is added
-        dev = qml.device("default.qubit", wires=2)
-
-        with ReversibleTape() as tape:
-            qml.PauliX(wires=0)
-            op(0.542, wires=[0, 1])
-            qml.expval(qml.PauliZ(0))
-
-        with pytest.raises(ValueError, match="The {} gate is not currently supported".format(name)):
-            tape.jacobian(dev)
-
-    def test_var_exception(self):
-        """Tests that an exception is raised when variance
-        is used with the ReversibleTape."""
-        # TODO: remove this test when this support is added
-        dev = qml.device("default.qubit", wires=2)
-
-        with ReversibleTape() as tape:
-            qml.PauliX(wires=0)
-            qml.RX(0.542, wires=0)
-            qml.var(qml.PauliZ(0))
-
-        with pytest.raises(ValueError, match="Variance is not supported"):
-            tape.jacobian(dev)
-
-    def test_probs_exception(self):
-        """Tests that an exception is raised when probability
-        is used with the ReversibleTape."""
-        # TODO: remove this test when this support is added
-        dev = qml.device("default.qubit", wires=2)
-
-        with ReversibleTape() as tape:
-            qml.PauliX(wires=0)
-            qml.RX(0.542, wires=0)
-            qml.probs(wires=[0, 1])
-
-        with pytest.raises(ValueError, match="Probability is not supported"):
-            tape.jacobian(dev)
-
-    def test_phaseshift_exception(self):
-        """Tests that an exception is raised when a PhaseShift gate
-        is used with the ReversibleTape."""
-        # TODO: remove this test when this support is added
-        dev = qml.device("default.qubit", wires=1)
-
+    @pytest.mark.parametrize(
+        "build_fn, match",
+        [
+            (
+                lambda: (
+                    qml.PauliX(wires=0),
+                    qml.CRX(0.542, wires=[0, 1]),
+                    qml.expval(qml.PauliZ(0)),
+                ),
+                "The CRX gate is not currently supported",
+            ),
+            (
+                lambda: (
+                    qml.PauliX(wires=0),
+                    qml.CRY(0.542, wires=[0, 1]),
+                    qml.expval(qml.PauliZ(0)),
+                ),
+                "The CRY gate is not currently supported",
+            ),
+            (
+                lambda: (
+                    qml.PauliX(wires=0),
+                    qml.CRZ(0.542, wires=[0, 1]),
+                    qml.expval(qml.PauliZ(0)),
+                ),
+                "The CRZ gate is not currently supported",
+            ),
+            (
+                lambda: (qml.PauliX(wires=0), qml.RX(0.542, wires=0), qml.var(qml.PauliZ(0))),
+                "Variance is not supported",
+            ),
+            (
+                lambda: (qml.PauliX(wires=0), qml.RX(0.542, wires=0), qml.probs(wires=[0, 1])),
+                "Probability is not supported",
+            ),
+            (
+                lambda: (
+                    qml.PauliX(wires=0),
+                    qml.PhaseShift(0.542, wires=0),
+                    qml.expval(qml.PauliZ(0)),
+                ),
+                "The PhaseShift gate is not currently supported",
+            ),
+        ],
+        ids=["CRX", "CRY", "CRZ", "var", "probs", "PhaseShift"],
+    )
+    def test_unsupported_exception(self, build_fn, match, dev2):
+        """Tests that an exception is raised when an unsupported gate or
+        measurement is used with the ReversibleTape."""
+        # TODO: remove the corresponding case when support is added
         with ReversibleTape() as tape:
-            qml.PauliX(wires=0)
-            qml.PhaseShift(0.542, wires=0)
-            qml.expval(qml.PauliZ(0))
+            build_fn()
 
-        with pytest.raises(ValueError, match="The PhaseShift gate is not currently supported"):
-            tape.jacobian(dev)
+        with pytest.raises(ValueError, match=match):
+            tape.jacobian(dev2)
 
 
 class TestGradients:
     """Jacobian integration tests for qubit expectations."""
 
-    @pytest.mark.parametrize("theta", np.linspace(-2 * np.pi, 2 * np.pi, 7))
     @pytest.mark.parametrize("G", [qml.RX, qml.RY, qml.RZ])
-    def test_pauli_rotation_gradient(self, G, theta, tol):
+    def test_pauli_rotation_gradient(self, G, tol, dev1):
         """Tests that the automatic gradients of Pauli rotations are correct."""
-        dev = qml.device("default.qubit", wires=1)
+        tape = _rotation_tape(G, _ROT_THETA[:1])
 
-        with ReversibleTape() as tape:
-            qml.QubitStateVector(np.array([1.0, -1.0]) / np.sqrt(2), wires=0)
-            G(theta, wires=[0])
-            qml.expval(qml.PauliZ(0))
+        # parameter-shift rule for every theta, evaluated as a single batch
+        expected = _param_shift_jacobians(tape, _ROT_THETA[:, None], dev1)
 
-        tape.trainable_params = {1}
+        for t, exp in zip(_ROT_THETA, expected):
+            tape.set_parameters([t])
+            autograd_val = tape.jacobian(dev1, method="analytic")
+            assert np.allclose(autograd_val, exp, atol=tol, rtol=0)
 
-        autograd_val = tape.jacobian(dev, method="analytic")
+    def test_Rot_gradient(self, tol, dev1):
+        """Tests that the automatic gradient of a arbitrary Euler-angle-parameterized gate is correct."""
+        tape = _rotation_tape(qml.Rot, _ROT_PARAMS[0])
 
-        # compare to finite differences
-        numeric_val = tape.jacobian(dev, method="numeric")
-        assert np.allclose(autograd_val, numeric_val, atol=tol, rtol=0)
+        # parameter-shift rule for every theta and every Euler angle,
+        # evaluated as a single batch
+        expected = _param_shift_jacobians(tape, _ROT_PARAMS, dev1)
 
-    @pytest.mark.parametrize("theta", np.linspace(-2 * np.pi, 2 * np.pi, 7))
-    def test_Rot_gradient(self, theta, tol):
-        """Tests that the automatic gradient of a arbitrary Euler-angle-parameterized gate is correct."""
-        dev = qml.device("default.qubit", wires=1)
-        params = np.array([theta, theta ** 3, np.sqrt(2) * theta])
+        for p, exp in zip(_ROT_PARAMS, expected):
+            tape.set_parameters(p)
+            autograd_val = tape.jacobian(dev1, method="analytic")
+            assert np.allclose(autograd_val, exp, atol=tol, rtol=0)
+
+    @slow
+    @pytest.mark.parametrize("G", [qml.RX, qml.RY, qml.RZ])
+    def test_pauli_rotation_gradient_numeric(self, G, tol, dev1):
+        """Tests that the automatic gradients of Pauli rotations agree with
+        finite differences."""
+        tape = _rotation_tape(G, _ROT_THETA[:1])
+
+        for t in _ROT_THETA:
+            tape.set_parameters([t])
+            autograd_val = tape.jacobian(dev1, method="analytic")
+            numeric_val = tape.jacobian(dev1, method="numeric")
+            assert np.allclose(autograd_val, numeric_val, atol=tol, rtol=0)
+
+    @slow
+    def test_Rot_gradient_numeric(self, tol, dev1):
+        """Tests that the automatic gradient of a arbitrary Euler-angle-parameterized
+        gate agrees with finite differences."""
+        tape = _rotation_tape(qml.Rot, _ROT_PARAMS[0])
+
+        for p in _ROT_PARAMS:
+            tape.set_parameters(p)
+            autograd_val = tape.jacobian(dev1, method="analytic")
+            numeric_val = tape.jacobian(dev1, method="numeric")
+            assert np.allclose(autograd_val, numeric_val, atol=tol, rtol=0)
+
+    # integers, floats, zero
+    @pytest.mark.parametrize(
+        "par, expected", [(v, float(np.cos(v))) for v in (1, -2, 1.623, -0.051, 0)]
+    )
+    def test_ry_gradient_values(self, par, expected, tol, dev1):
+        """Test that the gradient of the RY gate matches the exact analytic
+        formula."""
 
         with ReversibleTape() as tape:
-            qml.QubitStateVector(np.array([1.0, -1.0]) / np.sqrt(2), wires=0)
-            qml.Rot(*params, wires=[0])
-            qml.expval(qml.PauliZ(0))
+            qml.RY(par, wires=[0])
+            qml.expval(qml.PauliX(0))
 
-        tape.trainable_params = {1, 2, 3}
+        tape.trainable_params = {0}
 
-        autograd_val = tape.jacobian(dev, method="analytic")
+        # gradients
+        grad_F = tape.jacobian(dev1, method="numeric")
+        grad_A = tape.jacobian(dev1, method="analytic")
 
-        # compare to finite differences
-        numeric_val = tape.jacobian(dev, method="numeric")
-        assert np.allclose(autograd_val, numeric_val, atol=tol, rtol=0)
+        # different methods must agree
+        assert np.allclose(grad_F, expected, atol=tol, rtol=0)
+        assert np.allclose(grad_A, expected, atol=tol, rtol=0)
 
-    @pytest.mark.parametrize("par", [1, -2, 1.623, -0.051, 0])  # intergers, floats, zero
-    def test_ry_gradient(self, par, mocker, tol):
-        """Test that the gradient of the RY gate matches the exact analytic
-        formula. Further, make sure the correct gradient methods
-        are being called."""
+    def test_ry_gradient_dispatch(self, mocker, dev1):
+        """Test that the correct gradient methods are being called
+        when differentiating the RY gate."""
 
         with ReversibleTape() as tape:
-            qml.RY(par, wires=[0])
+            qml.RY(1.0, wires=[0])
             qml.expval(qml.PauliX(0))
 
         tape.trainable_params = {0}
 
-        dev = qml.device("default.qubit", wires=1)
-
         spy_numeric = mocker.spy(tape, "numeric_pd")
         spy_analytic = mocker.spy(tape, "analytic_pd")
 
-        # gradients
-        exact = np.cos(par)
-        grad_F = tape.jacobian(dev, method="numeric")
+        tape.jacobian(dev1, method="numeric")
 
         spy_numeric.assert_called()
         spy_analytic.assert_not_called()
 
         spy_device = mocker.spy(tape, "execute_device")
-        grad_A = tape.jacobian(dev, method="analytic")
+        tape.jacobian(dev1, method="analytic")
 
         spy_analytic.assert_called()
         spy_device.assert_called_once()  # check that the state was only pre-computed once
 
-        # different methods must agree
-        assert np.allclose(grad_F, exact, atol=tol, rtol=0)
-        assert np.allclose(grad_A, exact, atol=tol, rtol=0)
-
-    def test_rx_gradient(self, tol):
-        """Test that the gradient of the RX gate matches the known formula."""
-        dev = qml.device("default.qubit", wires=2)
-        a = 0.7418
-
-        with ReversibleTape() as tape:
-            qml.RX(a, wires=0)
-            qml.expval(qml.PauliZ(0))
-
-        circuit_output = tape.execute(dev)
-        expected_output = np.cos(a)
-        assert np.allclose(circuit_output, expected_output, atol=tol, rtol=0)
-
-        # circuit jacobians
-        circuit_jacobian = tape.jacobian(dev, method="analytic")
-        expected_jacobian = -np.sin(a)
-        assert np.allclose(circuit_jacobian, expected_jacobian, atol=tol, rtol=0)
-
-    def test_multiple_rx_gradient(self, tol):
-        """Tests that the gradient of multiple RX gates in a circuit
-        yeilds the correct result."""
-        dev = qml.device("default.qubit", wires=3)
-        params = np.array([np.pi, np.pi / 2, np.pi / 3])
-
+    @pytest.mark.parametrize(
+        "params, expected_output, expected_jacobian",
+        [
+            (p, np.cos(p), -np.diag(np.sin(p)))
+            for p in map(np.array, ([0.7418], [-5.0, np.pi / 7], [np.pi, np.pi / 2, np.pi / 3]))
+        ],
+    )
+    def test_rx_gradient(self, params, expected_output, expected_jacobian, tol, dev3):
+        """Tests that the gradient of one or more RX gates in a circuit
+        matches the known formula."""
         with ReversibleTape() as tape:
-            qml.RX(params[0], wires=0)
-            qml.RX(params[1], wires=1)
-            qml.RX(params[2], wires=2)
+            for idx, p in enumerate(params):
+                qml.RX(p, wires=idx)
 
-            for idx in range(3):
+            for idx in range(len(params)):
                 qml.expval(qml.PauliZ(idx))
 
-        circuit_output = tape.execute(dev)
-        expected_output = np.cos(params)
+        circuit_output = tape.execute(dev3)
         assert np.allclose(circuit_output, expected_output, atol=tol, rtol=0)
 
         # circuit jacobians
-        circuit_jacobian = tape.jacobian(dev, method="analytic")
-        expected_jacobian = -np.diag(np.sin(params))
+        circuit_jacobian = tape.jacobian(dev3, method="analytic")
         assert np.allclose(circuit_jacobian, expected_jacobian, atol=tol, rtol=0)
 
-    qubit_ops = [getattr(qml, name) for name in qml.ops._qubit__ops__]
-    analytic_qubit_ops = {cls for cls in qubit_ops if cls.grad_method == "A"}
-    analytic_qubit_ops = analytic_qubit_ops - {
-        qml.CRX,
-        qml.CRY,
-        qml.CRZ,
-        qml.CRot,
-        qml.PhaseShift,
-        qml.PauliRot,
-        qml.MultiRZ,
-        qml.U1,
-        qml.U2,
-        qml.U3,
-    }
-
-    @pytest.mark.parametrize("obs", [qml.PauliX, qml.PauliY])
-    @pytest.mark.parametrize("op", analytic_qubit_ops)
-    def test_gradients(self, op, obs, mocker, tol):
-        """Tests that the gradients of circuits match between the
-        finite difference and analytic methods."""
-        args = np.linspace(0.2, 0.5, op.num_params)
-
-        with ReversibleTape() as tape:
-            qml.Hadamard(wires=0)
-            qml.RX(0.543, wires=0)
-            qml.CNOT(wires=[0, 1])
-
-            op(*args, wires=range(op.num_wires))
+    @pytest.mark.parametrize("obs", [qml.PauliX, qml.PauliY], ids=_name_id)
+    @pytest.mark.parametrize("op", _ANALYTIC_OPS, ids=_name_id)
+    def test_gradients(self, op, obs, mocker, tol, dev2, tape_cache):
+        """Tests that the gradients of circuits are computed analytically,
+        with a single execution of the device, and match the parameter-shift
+        rule."""
+        tape = tape_cache[op]
+        tape._measurements[0] = MeasurementProcess(qml.operation.Expectation, obs=obs(wires=0))
+        tape._update_observables()
 
-            qml.Rot(1.3, -2.3, 0.5, wires=[0])
-            qml.RZ(-0.5, wires=0)
-            qml.RY(0.5, wires=1)
-            qml.CNOT(wires=[0, 1])
-
-            qml.expval(obs(wires=0))
-            qml.expval(qml.PauliZ(wires=1))
-
-        dev = qml.device("default.qubit", wires=2)
-        res = tape.execute(dev)
-
-        tape._update_gradient_info()
-        tape.trainable_params = set(range(1, 1 + op.num_params))
+        res = tape.execute(dev2)
 
         # check that every parameter is analytic
         for i in range(op.num_params):
             assert tape._par_info[1 + i]["grad_method"][0] == "A"
 
-        grad_F = tape.jacobian(dev, method="numeric")
-
         spy = mocker.spy(ReversibleTape, "analytic_pd")
         spy_execute = mocker.spy(tape, "execute_device")
-        grad_A = tape.jacobian(dev, method="analytic")
+        grad_A = tape.jacobian(dev2, method="analytic")
         spy.assert_called()
 
         # check that the execute device method has only been called
         # once, for all parameters.
         spy_execute.assert_called_once()
 
-        assert np.allclose(grad_A, grad_F, atol=tol, rtol=0)
-
-    def test_gradient_gate_with_multiple_parameters(self, tol):
-        """Tests that gates with multiple free parameters yield correct gradients."""
-        x, y, z = [0.5, 0.3, -0.7]
+        expected = _param_shift_jacobians(tape, np.array([tape.get_parameters()]), dev2)[0]
+        assert np.allclose(grad_A, expected, atol=tol, rtol=0)
 
-        with ReversibleTape() as tape:
-            qml.RX(0.4, wires=[0])
-            qml.Rot(x, y, z, wires=[0])
-            qml.RY(-0.2, wires=[0])
-            qml.expval(qml.PauliZ(0))
+    @slow
+    @pytest.mark.parametrize("obs", [qml.PauliX, qml.PauliY], ids=_name_id)
+    @pytest.mark.parametrize("op", _ANALYTIC_OPS, ids=_name_id)
+    def test_gradients_numeric(self, op, obs, tol, dev2, tape_cache):
+        """Tests that the gradients of circuits match between the
+        finite difference and analytic methods."""
+        tape = tape_cache[op]
+        tape._measurements[0] = MeasurementProcess(qml.operation.Expectation, obs=obs(wires=0))
+        tape._update_observables()
 
-        tape.trainable_params = {1, 2, 3}
+        grad_F = tape.jacobian(dev2, method="numeric")
+        grad_A = tape.jacobian(dev2, method="analytic")
+        assert np.allclose(grad_A, grad_F, atol=tol, rtol=0)
 
-        dev = qml.device("default.qubit", wires=1)
-        grad_A = tape.jacobian(dev, method="analytic")
-        grad_F = tape.jacobian(dev, method="numeric")
+    def test_gradient_gate_with_multiple_parameters(self, dev1):
+        """Tests that gates with multiple free parameters yield a gradient
+        for every parameter."""
+        tape = _multi_param_tape()
+        grad_A = tape.jacobian(dev1, method="analytic")
 
         # gradient has the correct shape and every element is nonzero
         assert grad_A.shape == (1, 3)
-        assert np.count_nonzero(grad_A) == 3
+        assert np.all(grad_A != 0)
+
+    @slow
+    def test_gradient_gate_with_multiple_parameters_numeric(self, tol, dev1):
+        """Tests that the gradients of gates with multiple free parameters
+        match between the finite difference and analytic methods."""
+        tape = _multi_param_tape()
+        grad_A = tape.jacobian(dev1, method="analytic")
+        grad_F = tape.jacobian(dev1, method="numeric")
+
         # the different methods agree
         assert np.allclose(grad_A, grad_F, atol=tol, rtol=0)
 
@@ -358,11 +489,10 @@ class TestGradients:
 class TestQNodeIntegration:
     """Test QNode integration with the reversible method"""
 
-    def test_qnode(self, mocker, tol):
+    def test_qnode(self, mocker, tol, dev2):
         """Test that specifying diff_method allows the reversible
         method to be selected"""
         args = np.array([0.54, 0.1, 0.5], requires_grad=True)
-        dev = qml.device("default.qubit", wires=2)
 
         def circuit(x, y, z):
             qml.Hadamard(wires=0)
@@ -378,7 +508,7 @@ class TestQNodeIntegration:
 
             return qml.expval(qml.PauliX(0) @ qml.PauliZ(1))
 
-        qnode1 = QNode(circuit, dev, diff_method="reversible")
+        qnode1 = QNode(circuit, dev2, diff_method="reversible")
         spy = mocker.spy(ReversibleTape, "analytic_pd")
 
         grad_fn = qml.grad(qnode1)
@@ -387,66 +517,68 @@ class TestQNodeIntegration:
         spy.assert_called()
         assert isinstance(qnode1.qtape, ReversibleTape)
 
-        qnode2 = QNode(circuit, dev, diff_method="finite-diff")
+        qnode2 = QNode(circuit, dev2, diff_method="finite-diff")
         grad_fn = qml.grad(qnode2)
         grad_F = grad_fn(*args)
 
         assert not isinstance(qnode2.qtape, ReversibleTape)
         assert np.allclose(grad_A, grad_F, atol=tol, rtol=0)
 
-    @pytest.mark.parametrize("reused_p", thetas ** 3 / 19)
-    @pytest.mark.parametrize("other_p", thetas ** 2 / 1)
-    def test_fanout_multiple_params(self, reused_p, other_p, tol):
+    def test_fanout_multiple_params(self, tol, dev1):
         """Tests that the correct gradient is computed for qnodes which
         use the same parameter in multiple gates."""
 
-        from gate_data import Rotx as Rx, Roty as Ry, Rotz as Rz
-
         def expZ(state):
-            return np.abs(state[0]) ** 2 - np.abs(state[1]) ** 2
+            return np.abs(state[..., 0]) ** 2 - np.abs(state[..., 1]) ** 2
 
-        dev = qml.device("default.qubit", wires=1)
         extra_param = np.array(0.31, requires_grad=False)
+        reused_p = np.array(_THETAS3)
+        other_p = np.array(_THETAS2)
 
-        @qnode(dev)
-        def cost(p1, p2):
+        def circuit(p1, p2):
             qml.RX(extra_param, wires=[0])
             qml.RY(p1, wires=[0])
             qml.RZ(p2, wires=[0])
             qml.RX(p1, wires=[0])
             return qml.expval(qml.PauliZ(0))
 
-        zero_state = np.array([1.0, 0.0])
+        # the QNode is constructed once, and evaluated over the whole grid
+        cost = QNode(circuit, dev1, diff_method="reversible")
 
-        # analytic gradient
+        # analytic gradient over the (reused_p, other_p) grid
         grad_fn = qml.grad(cost)
-        grad_A = grad_fn(reused_p, other_p)
+        grad_A = np.array([[grad_fn(p1, p2)[0] for p2 in other_p] for p1 in reused_p])
 
-        # manual gradient
-        grad_true0 = (
-            expZ(
-                Rx(reused_p) @ Rz(other_p) @ Ry(reused_p + np.pi / 2) @ Rx(extra_param) @ zero_state
-            )
-            - expZ(
-                Rx(reused_p) @ Rz(other_p) @ Ry(reused_p - np.pi / 2) @ Rx(extra_param) @ zero_state
+        # manual gradient, computed over the whole grid at once
+        zero_state = np.array([1.0, 0.0])
+        Rz_other = Rotz_batch(other_p)
+
+        def final_state(rx_params, ry_params):
+            """Final states of shape (len(reused_p), len(other_p), 2)"""
+            return np.einsum(
+                "iab,jbc,icd,de,e->ija",
+                Rotx_batch(rx_params),
+                Rz_other,
+                Roty_batch(ry_params),
+                Rx(extra_param),
+                zero_state,
             )
+
+        grad_true0 = (
+            expZ(final_state(reused_p, reused_p + np.pi / 2))
+            - expZ(final_state(reused_p, reused_p - np.pi / 2))
         ) / 2
         grad_true1 = (
-            expZ(
-                Rx(reused_p + np.pi / 2) @ Rz(other_p) @ Ry(reused_p) @ Rx(extra_param) @ zero_state
-            )
-            - expZ(
-                Rx(reused_p - np.pi / 2) @ Rz(other_p) @ Ry(reused_p) @ Rx(extra_param) @ zero_state
-            )
+            expZ(final_state(reused_p + np.pi / 2, reused_p))
+            - expZ(final_state(reused_p - np.pi / 2, reused_p))
         ) / 2
         expected = grad_true0 + grad_true1  # product rule
 
-        assert np.allclose(grad_A[0], expected, atol=tol, rtol=0)
+        assert np.allclose(grad_A, expected, atol=tol, rtol=0)
 
-    def test_gradient_repeated_gate_parameters(self, mocker, tol):
+    def test_gradient_repeated_gate_parameters(self, mocker, tol, dev1):
         """Tests that repeated use of a free parameter in a
         multi-parameter gate yield correct gradients."""
-        dev = qml.device("default.qubit", wires=1)
         params = np.array([0.8, 1.3], requires_grad=True)
 
         def circuit(params):
@@ -457,14 +589,14 @@ class TestQNodeIntegration:
         spy_numeric = mocker.spy(JacobianTape, "numeric_pd")
         spy_analytic = mocker.spy(ReversibleTape, "analytic_pd")
 
-        cost = QNode(circuit, dev, diff_method="finite-diff")
+        cost = QNode(circuit, dev1, diff_method="finite-diff")
         grad_fn = qml.grad(cost)
         grad_F = grad_fn(params)
 
         spy_numeric.assert_called()
         spy_analytic.assert_not_called()
 
-        cost = QNode(circuit, dev, diff_method="reversible")
+        cost = QNode(circuit, dev1, diff_method="reversible")
         grad_fn = qml.grad(cost)
         grad_A = grad_fn(params)
 
@@ -485,23 +617,36 @@ class TestHelperFunctions:
     two_qubit_obs = qml.Hermitian(np.eye(4), wires=[0, 1])
 
     @pytest.mark.parametrize(
-        "wires, vec1, obs, vec2, expected",
+        "wires, cases",
         [
-            (1, one_qubit_vec1, single_qubit_obs1, one_qubit_vec1, 0),
-            (1, one_qubit_vec2, single_qubit_obs1, one_qubit_vec2, 0),
-            (1, one_qubit_vec1, single_qubit_obs1, one_qubit_vec2, 1 - 1j),
-            (1, one_qubit_vec2, single_qubit_obs1, one_qubit_vec1, 1 + 1j),
-            (1, one_qubit_vec1, single_qubit_obs2, one_qubit_vec1, 0),
-            (1, one_qubit_vec2, single_qubit_obs2, one_qubit_vec2, 2),
-            (1, one_qubit_vec1, single_qubit_obs2, one_qubit_vec2, 1 + 1j),
-            (1, one_qubit_vec2, single_qubit_obs2, one_qubit_vec1, 1 - 1j),
-            (2, two_qubit_vec, single_qubit_obs1, two_qubit_vec, 0),
-            (2, two_qubit_vec, single_qubit_obs2, two_qubit_vec, 0),
-            (2, two_qubit_vec, two_qubit_obs, two_qubit_vec, 4),
+            (
+                1,
+                [
+                    (one_qubit_vec1, single_qubit_obs1, one_qubit_vec1, 0),
+                    (one_qubit_vec2, single_qubit_obs1, one_qubit_vec2, 0),
+                    (one_qubit_vec1, single_qubit_obs1, one_qubit_vec2, 1 - 1j),
+                    (one_qubit_vec2, single_qubit_obs1, one_qubit_vec1, 1 + 1j),
+                    (one_qubit_vec1, single_qubit_obs2, one_qubit_vec1, 0),
+                    (one_qubit_vec2, single_qubit_obs2, one_qubit_vec2, 2),
+                    (one_qubit_vec1, single_qubit_obs2, one_qubit_vec2, 1 + 1j),
+                    (one_qubit_vec2, single_qubit_obs2, one_qubit_vec1, 1 - 1j),
+                ],
+            ),
+            (
+                2,
+                [
+                    (two_qubit_vec, single_qubit_obs1, two_qubit_vec, 0),
+                    (two_qubit_vec, single_qubit_obs2, two_qubit_vec, 0),
+                    (two_qubit_vec, two_qubit_obs, two_qubit_vec, 4),
+                ],
+            ),
         ],
     )
-    def test_matrix_elem(self, wires, vec1, obs, vec2, expected):
+    def test_matrix_elem(self, wires, cases, tol):
         """Tests for the helper function _matrix_elem"""
         tape = ReversibleTape()
-        res = tape._matrix_elem(vec1, obs, vec2, qml.wires.Wires(range(wires)))
-        assert res == expected
+        dev_wires = qml.wires.Wires(range(wires))
+
+        res = [tape._matrix_elem(vec1, obs, vec2, dev_wires) for vec1, obs, vec2, _ in cases]
+        expected = [c[-1] for c in cases]
+        assert np.allclose(res, expected, atol=tol, rtol=0)